@@ -6,93 +6,85 @@ Part 1: Counts how many times the position lands exactly on 0.
 Part 2: Counts how many times position 0 is crossed during movement.
 """
 
-from enum import Enum
 from pathlib import Path
-from typing import List, Tuple
 
+import numpy as np
 
-class Direction(Enum):
-    """Represents the direction of movement on a dial."""
-    RIGHT = 'R'  # Move right (clockwise)
-    LEFT = 'L'   # Move left (counter-clockwise)
 
-
-class Instruction:
-    """Represents a single movement instruction with direction and step count."""
-    
-    def __init__(self, direction: str, steps: int):
-        """
-        Initialize an instruction.
-        
-        Args:
-            direction: Direction character ('R' or 'L')
-            steps: Number of steps to move
-            
-        Raises:
-            ValueError: If direction is not 'R' or 'L' or if steps is negative
-        """
-        if direction not in ('R', 'L'):
-            raise ValueError(f"Invalid direction: {direction}")
-        if steps < 0:
-            raise ValueError(f"Negative steps value: {steps}")
-            
-        self.direction = Direction(direction)
-        self.steps = steps
-    
-    def __repr__(self) -> str:
-        return f"Instruction({self.direction.value}, {self.steps})"
+# Steps are stored as int64 and summed cumulatively, so the total number of
+# steps is kept well below 2^63 to rule out overflow
+MAX_TOTAL_STEPS = 2 ** 62
 
 
-def read_input(file_path: Path) -> List[Instruction]:
+def read_input(file_path: Path) -> np.ndarray:
     """
     Read and parse instructions from an input file.
     
     Reads a file containing movement instructions, where each line consists of
-    a direction character ('R' or 'L') followed by a number of steps.
+    a direction character ('R' or 'L') followed by a number of steps. Each
+    instruction is converted to a signed step count: positive for right
+    (clockwise) and negative for left (counter-clockwise) movement.
     
     Args:
         file_path: Path to the input file
         
     Returns:
-        List of parsed Instruction objects
+        Array of signed step counts (int64), one per instruction
         
     Raises:
         FileNotFoundError: If the file doesn't exist
-        ValueError: If the file contains invalid instruction format
+        ValueError: If the file contains invalid instruction format or the
+            total number of steps exceeds MAX_TOTAL_STEPS
     """
     if not file_path.exists():
         raise FileNotFoundError(f"File does not exist: {file_path}")
     
-    instructions = []
-    
-    with open(file_path, 'r') as file:
-        for line_number, line in enumerate(file, start=1):
-            line = line.strip()
-            
-            if not line:
-                continue
-            
-            if len(line) < 2:
-                raise ValueError(
-                    f"Invalid instruction format at line {line_number}: {line}"
-                )
-            
-            direction_char = line[0]
-            number_part = line[1:]
-            
-            try:
-                steps = int(number_part)
-            except ValueError:
-                raise ValueError(
-                    f"Invalid number format at line {line_number}: {line}"
-                )
-            
-            try:
-                instructions.append(Instruction(direction_char, steps))
-            except ValueError as e:
-                raise ValueError(f"At line {line_number}: {e}")
-    
-    return instructions
+    # Read the whole file at once and preallocate one slot per line
+    lines = file_path.read_bytes().splitlines()
+    signed_steps = np.empty(len(lines), dtype=np.int64)
+    count = 0
+    total_steps = 0
+    
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        
+        if not line:
+            continue
+        
+        if len(line) < 2:
+            raise ValueError(
+                f"Invalid instruction format at line {line_number}: {line.decode()}"
+            )
+        
+        direction_char = line[:1]
+        number_part = line[1:]
+        
+        try:
+            steps = int(number_part)
+        except ValueError:
+            raise ValueError(
+                f"Invalid number format at line {line_number}: {line.decode()}"
+            )
+        
+        if direction_char not in (b'R', b'L'):
+            raise ValueError(
+                f"At line {line_number}: Invalid direction: {direction_char.decode()}"
+            )
+        if steps < 0:
+            raise ValueError(
+                f"At line {line_number}: Negative steps value: {steps}"
+            )
+        
+        total_steps += steps
+        if total_steps > MAX_TOTAL_STEPS:
+            raise ValueError(
+                f"At line {line_number}: Total steps exceed {MAX_TOTAL_STEPS}"
+            )
+        
+        signed_steps[count] = steps if direction_char == b'R' else -steps
+        count += 1
+    
+    return signed_steps[:count]
 
 
 def advent_of_code_2025_day1_part1(file_path: Path) -> int:
@@ -109,28 +101,16 @@ def advent_of_code_2025_day1_part1(file_path: Path) -> int:
     Returns:
         The number of times the position lands on 0
     """
-    instructions = read_input(file_path)
+    signed_steps = read_input(file_path)
     
     DIAL_RANGE = 99
     STARTING_POSITION = 50
     DIAL_SIZE = DIAL_RANGE + 1
     
-    position = STARTING_POSITION
-    zero_counter = 0
+    # Positions after every instruction, computed for all instructions at once
+    positions = (STARTING_POSITION + np.cumsum(signed_steps % DIAL_SIZE)) % DIAL_SIZE
     
-    for instruction in instructions:
-        steps = instruction.steps
-        effective_steps = steps % DIAL_SIZE
-        
-        if instruction.direction == Direction.RIGHT:
-            position = (position + effective_steps) % DIAL_SIZE
-        else:  # Direction.LEFT
-            position = (position - effective_steps) % DIAL_SIZE
-        
-        if position == 0:
-            zero_counter += 1
-    
-    return zero_counter
+    return int((positions == 0).sum())
 
 
 def advent_of_code_2025_day1_part2(file_path: Path) -> int:
@@ -141,9 +121,10 @@ def advent_of_code_2025_day1_part2(file_path: Path) -> int:
     movement, not just when landing on it. For example, moving from position 98 to
     position 2 crosses 0 once (98->99->0->1->2).
     
-    Uses an infinite number line representation where position can be negative,
-    then maps back to the 0-99 dial range. This allows for easier calculation
-    of zero crossings during movement.
+    Uses an infinite number line representation where position can be negative.
+    Every multiple of 100 passed on that line corresponds to a crossing of 0 on
+    the dial, so all crossings can be counted at once from the cumulative sum
+    of the signed steps.
     
     Args:
         file_path: Path to the input file containing instructions
@@ -151,44 +132,26 @@ def advent_of_code_2025_day1_part2(file_path: Path) -> int:
     Returns:
         Total number of times position 0 is crossed
     """
-    instructions = read_input(file_path)
+    signed_steps = read_input(file_path)
     
     DIAL_RANGE = 99
     STARTING_POSITION = 50
     DIAL_SIZE = DIAL_RANGE + 1
     
-    position = STARTING_POSITION
-    zero_counter = 0
-    
-    for instruction in instructions:
-        zero_hits = 0
-        old_position = position
-        steps = instruction.steps
-        
-        if instruction.direction == Direction.RIGHT:
-            end_pos = old_position + steps
-            first_zero = ((old_position // DIAL_SIZE) + 1) * DIAL_SIZE
-            
-            if first_zero <= end_pos:
-                zero_hits = ((end_pos - first_zero) // DIAL_SIZE) + 1
-            
-            position = end_pos % DIAL_SIZE
-            
-        else:  # Direction.LEFT
-            end_pos_raw = old_position - steps
-            first_zero_in_range = (old_position // DIAL_SIZE) * DIAL_SIZE
-            
-            if first_zero_in_range == old_position:
-                first_zero_in_range -= DIAL_SIZE
-            
-            if first_zero_in_range >= end_pos_raw:
-                zero_hits = ((first_zero_in_range - end_pos_raw) // DIAL_SIZE) + 1
-            
-            position = end_pos_raw % DIAL_SIZE
-        
-        zero_counter += zero_hits
-    
-    return zero_counter
+    # Unwrapped positions on the infinite number line before and after each instruction
+    positions = np.concatenate(
+        ([STARTING_POSITION], STARTING_POSITION + np.cumsum(signed_steps))
+    )
+    old_positions = positions[:-1]
+    new_positions = positions[1:]
+    
+    # Moving right hits every multiple of DIAL_SIZE in (old, new],
+    # moving left hits every multiple of DIAL_SIZE in [new, old)
+    right_hits = new_positions // DIAL_SIZE - old_positions // DIAL_SIZE
+    left_hits = (old_positions - 1) // DIAL_SIZE - (new_positions - 1) // DIAL_SIZE
+    zero_hits = np.where(signed_steps >= 0, right_hits, left_hits)
+    
+    return int(zero_hits.sum())
 
 
 def main():
@@ -1,25 +1,44 @@
 import re
 from itertools import combinations
 import numpy as np
-from scipy.optimize import linprog
-import pulp
+from scipy.optimize import milp, LinearConstraint, Bounds
+from scipy.sparse import csr_matrix
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - the Python Gray-code walk is used instead
+    njit = None
+
+# Patterns for the parts of a machine line, compiled once
+LIGHTS_PATTERN = re.compile(r'\[(.*?)\]')
+BUTTON_PATTERN = re.compile(r'\(([0-9,]+)\)')
+JOLTAGE_PATTERN = re.compile(r'\{([0-9,]+)\}')
+# Maps every indicator light character to its bit value ('#' is on, anything else off)
+LIGHTS_TABLE = bytes(1 if c == ord('#') else 0 for c in range(256))
+
+# Smallest kernel for which the compiled enumeration amortizes its JIT cost
+MIN_NATIVE_KERNEL = 16
+# Kernel vectors are packed into uint64 words for the compiled enumeration
+MAX_NATIVE_BUTTONS = 64
+# The compiled enumeration counts combinations in an int64, so 1 << kernel size must fit
+MAX_NATIVE_KERNEL = 62
 
 def parse_line(line):
     """Parse a single machine line to extract lights, buttons, and joltage."""
     # Extract indicator lights pattern
-    lights_match = re.search(r'\[(.*?)\]', line)
+    lights_match = LIGHTS_PATTERN.search(line)
     lights_str = lights_match.group(1)
-    target_lights = [1 if c == '#' else 0 for c in lights_str]
+    target_lights = list(lights_str.encode('ascii').translate(LIGHTS_TABLE))
     
     # Extract button configurations
     buttons = []
-    button_matches = re.findall(r'\(([0-9,]+)\)', line)
+    button_matches = BUTTON_PATTERN.findall(line)
     for button_str in button_matches:
         button_indices = [int(x) for x in button_str.split(',')]
         buttons.append(button_indices)
     
     # Extract joltage requirements
-    joltage_match = re.search(r'\{([0-9,]+)\}', line)
+    joltage_match = JOLTAGE_PATTERN.search(line)
     target_joltage = []
     if joltage_match:
         joltage_str = joltage_match.group(1)
@@ -27,6 +46,95 @@ def parse_line(line):
     
     return target_lights, buttons, target_joltage
 
+def solve_gf2(target, buttons):
+    """
+    Solve the lights system B * x = target over GF(2) with Gaussian elimination.
+    
+    Each light gives one equation, stored as an integer bitmask over buttons
+    together with its target bit. Returns a particular solution and a basis of
+    the kernel (both as bitmasks over buttons), or None if there is no solution.
+    """
+    n_lights = len(target)
+    n_buttons = len(buttons)
+    
+    # rows[light] = (bitmask of buttons toggling this light, target bit)
+    rows = []
+    for light_idx in range(n_lights):
+        row = 0
+        for btn_idx, button in enumerate(buttons):
+            if light_idx in button:
+                row |= 1 << btn_idx
+        rows.append((row, target[light_idx]))
+    
+    # Reduce to reduced row echelon form, remembering the pivot button of each row
+    pivots = []
+    rank = 0
+    for col in range(n_buttons):
+        pivot_row = next((r for r in range(rank, n_lights) if rows[r][0] >> col & 1), None)
+        if pivot_row is None:
+            continue
+        rows[rank], rows[pivot_row] = rows[pivot_row], rows[rank]
+        pivot_mask, pivot_bit = rows[rank]
+        for r in range(n_lights):
+            if r != rank and rows[r][0] >> col & 1:
+                rows[r] = (rows[r][0] ^ pivot_mask, rows[r][1] ^ pivot_bit)
+        pivots.append(col)
+        rank += 1
+    
+    # A zero row with a non-zero target bit means the system is inconsistent
+    if any(row == 0 and bit for row, bit in rows[rank:]):
+        return None
+    
+    # Particular solution: all free buttons unpressed, pivot buttons take the target bit
+    particular = 0
+    for r, col in enumerate(pivots):
+        if rows[r][1]:
+            particular |= 1 << col
+    
+    # Kernel basis: press one free button and fix the pivot buttons it affects
+    kernel = []
+    pivot_set = set(pivots)
+    for free_col in range(n_buttons):
+        if free_col in pivot_set:
+            continue
+        vector = 1 << free_col
+        for r, col in enumerate(pivots):
+            if rows[r][0] >> free_col & 1:
+                vector |= 1 << col
+        kernel.append(vector)
+    
+    return particular, kernel
+
+if njit is not None:
+    @njit(cache=True)
+    def _popcount(value):
+        """Count set bits of a uint64 value."""
+        count = 0
+        while value:
+            value &= value - np.uint64(1)
+            count += 1
+        return count
+
+    @njit(cache=True)
+    def _gray_min(kernel_masks, particular):
+        """
+        Find the minimum popcount of particular XOR any combination of kernel vectors.
+        Combinations are walked in Gray-code order, so each step is a single XOR.
+        """
+        current = particular
+        min_presses = _popcount(current)
+
+        for i in range(1, 1 << len(kernel_masks)):
+            bit = 0
+            while not (i >> bit) & 1:
+                bit += 1
+            current ^= kernel_masks[bit]
+            presses = _popcount(current)
+            if presses < min_presses:
+                min_presses = presses
+
+        return min_presses
+
 def find_min_presses(target, buttons):
     """
     Find minimum number of button presses to achieve target configuration.
@@ -35,31 +143,30 @@ def find_min_presses(target, buttons):
     
     Since each button toggles (XOR operation), pressing it twice = not pressing.
     So we only care about pressing each button 0 or 1 times.
-    This becomes a system of linear equations over GF(2).
+    This becomes a system of linear equations over GF(2): every solution is
+    the particular solution XOR a combination of kernel vectors, so only
+    2^(kernel size) candidates need to be checked instead of 2^n_buttons.
     """
-    n_lights = len(target)
-    n_buttons = len(buttons)
+    solution = solve_gf2(target, buttons)
+    if solution is None:
+        return 0
+    particular, kernel = solution
+    
+    if (njit is not None
+            and MIN_NATIVE_KERNEL <= len(kernel) <= MAX_NATIVE_KERNEL
+            and len(buttons) <= MAX_NATIVE_BUTTONS):
+        return _gray_min(np.array(kernel, dtype=np.uint64), np.uint64(particular))
+    
+    # Walk all kernel combinations in Gray-code order on Python ints
+    current = particular
+    min_presses = bin(current).count('1')
+    
+    for i in range(1, 1 << len(kernel)):
+        bit = (i & -i).bit_length() - 1
+        current ^= kernel[bit]
+        min_presses = min(min_presses, bin(current).count('1'))
     
-    # Try all combinations of buttons (2^n_buttons possibilities)
-    # For small n_buttons this is feasible
-    min_presses = float('inf')
-    
-    for mask in range(1 << n_buttons):
-        # Calculate resulting light configuration
-        lights = [0] * n_lights
-        presses = 0
-        
-        for i in range(n_buttons):
-            if mask & (1 << i):
-                presses += 1
-                for light_idx in buttons[i]:
-                    if light_idx < n_lights:
-                        lights[light_idx] ^= 1
-        
-        if lights == target:
-            min_presses = min(min_presses, presses)
-    
-    return min_presses if min_presses != float('inf') else 0
+    return min_presses
 
 def advent_of_code_2025_day10_part1(filename):
     """Solve the factory initialization problem - Part 1."""
@@ -81,7 +188,7 @@ def advent_of_code_2025_day10_part1(filename):
 def find_min_presses_joltage(target_joltage, buttons):
     """
     Find minimum number of button presses using Integer Linear Programming.
-    This guarantees optimal solution.
+    This guarantees optimal solution unlike regular LP with rounding.
     """
     n_counters = len(target_joltage)
     n_buttons = len(buttons)
@@ -89,108 +196,43 @@ def find_min_presses_joltage(target_joltage, buttons):
     if n_counters == 0:
         return 0
     
-    # Use ILP solver for all cases - it's fast and gives optimal solution
-    return find_min_presses_joltage_lp(target_joltage, buttons)
-
-def find_min_presses_joltage_lp(target_joltage, buttons):
-    """
-    Use Integer Linear Programming to find minimum button presses.
-    This guarantees optimal solution unlike regular LP with rounding.
-    """
-    n_counters = len(target_joltage)
-    n_buttons = len(buttons)
-    
-    # Create the problem
-    prob = pulp.LpProblem("MinButtonPresses", pulp.LpMinimize)
-    
-    # Decision variables: number of times to press each button (non-negative integers)
-    button_vars = [pulp.LpVariable(f"button_{i}", lowBound=0, cat='Integer') for i in range(n_buttons)]
-    
-    # Objective: minimize total button presses
-    prob += pulp.lpSum(button_vars)
-    
-    # Constraints: for each counter, sum of button presses affecting it must equal target
-    for counter_idx in range(n_counters):
-        constraint = []
-        for btn_idx in range(n_buttons):
-            if counter_idx in buttons[btn_idx]:
-                constraint.append(button_vars[btn_idx])
-        
-        if constraint:
-            prob += pulp.lpSum(constraint) == target_joltage[counter_idx]
-    
-    # Solve
-    prob.solve(pulp.PULP_CBC_CMD(msg=0))
+    # Constraint matrix: A[counter, button] = 1 if the button increases the counter
+    rows = []
+    cols = []
+    for btn_idx, button in enumerate(buttons):
+        for counter_idx in set(button):
+            if counter_idx < n_counters:
+                rows.append(counter_idx)
+                cols.append(btn_idx)
     
-    # Check if solution found
-    if prob.status == pulp.LpStatusOptimal:
-        total = sum(int(var.varValue) for var in button_vars)
-        return total
-    
-    # If ILP failed, fall back to exhaustive for very small cases
-    if n_buttons <= 8:
-        return find_min_presses_joltage_exhaustive(target_joltage, buttons)
-    
-    return 0
-
-def find_min_presses_joltage_exhaustive(target_joltage, buttons):
-    """
-    Exhaustive search for minimum button presses.
-    Try different combinations up to a reasonable limit.
-    """
-    from itertools import product
-    
-    n_counters = len(target_joltage)
-    n_buttons = len(buttons)
-    max_target = max(target_joltage) if target_joltage else 0
+    if not rows:
+        return 0
     
-    # Upper bound: press buttons individually up to max needed
-    max_presses_per_button = max_target * 2  # generous upper bound
+    A = csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n_counters, n_buttons))
     
-    # For small examples, we can try different combinations
-    # Use BFS-like approach: try increasing total presses until we find solution
+    # Counters not affected by any button are left unconstrained
+    affected = np.unique(rows)
+    target = np.array(target_joltage, dtype=float)[affected]
+    constraints = LinearConstraint(A[affected], target, target)
     
-    for total_presses in range(sum(target_joltage) + 1):
-        # Generate all ways to distribute total_presses among buttons
-        # This is still exponential but bounded
-        if n_buttons > 10:  # Too many buttons for exhaustive
-            break
-            
-        # Try to find any valid distribution
-        found = try_distribute_presses(total_presses, n_buttons, buttons, target_joltage)
-        if found is not None:
-            return total_presses
+    # Decision variables: number of times to press each button (non-negative integers).
+    # No button can be pressed more often than the highest target counter value.
+    bounds = Bounds(0, max(target_joltage))
     
-    return 0  # Fallback
-
-def try_distribute_presses(total_presses, n_buttons, buttons, target_joltage):
-    """Try to distribute total_presses among buttons to achieve target."""
-    from itertools import combinations_with_replacement
+    # Objective: minimize total button presses. Solved in-process by HiGHS.
+    result = milp(
+        c=np.ones(n_buttons),
+        constraints=constraints,
+        integrality=np.ones(n_buttons),
+        bounds=bounds,
+    )
     
-    n_counters = len(target_joltage)
+    if not result.success:
+        raise RuntimeError(
+            f"No optimal solution for joltage {target_joltage}: {result.message}"
+        )
     
-    # Generate all partitions of total_presses into n_buttons non-negative integers
-    def generate_partitions(n, k):
-        """Generate all ways to partition n into k non-negative integers."""
-        if k == 1:
-            yield [n]
-            return
-        for i in range(n + 1):
-            for rest in generate_partitions(n - i, k - 1):
-                yield [i] + rest
-    
-    for partition in generate_partitions(total_presses, n_buttons):
-        # Check if this partition achieves the target
-        counters = [0] * n_counters
-        for btn_idx, presses in enumerate(partition):
-            for counter_idx in buttons[btn_idx]:
-                if counter_idx < n_counters:
-                    counters[counter_idx] += presses
-        
-        if counters == target_joltage:
-            return partition
-    
-    return None
+    return int(round(result.x.sum()))
 
 def advent_of_code_2025_day10_part2(filename):
     """Solve the factory initialization problem - Part 2 (Joltage)."""
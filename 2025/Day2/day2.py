@@ -8,11 +8,32 @@ Part 2: Calculates the sum of all IDs with repeating patterns.
         repeated at least twice (e.g., 123123, 77777, 454545).
 """
 
+import re
+from functools import lru_cache
+from itertools import combinations
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 
+# Precomputed powers 10^0 .. 10^19 (digit counts of every int64 value);
+# larger exponents are computed on demand by power_of_10
+POWERS_OF_10 = [10 ** i for i in range(20)]
+# Proper divisors (possible pattern lengths) of every int64 ID length
+PATTERN_LENGTHS = {
+    length: [d for d in range(1, length // 2 + 1) if length % d == 0]
+    for length in range(1, 20)
+}
+
+# A single "start-end" token between commas, accepting the same tokens as
+# Range.from_string: int() number syntax (optional sign, digit-group underscores,
+# Unicode digits) and whitespace around the dash. int() does not strip the
+# separators \x1c-\x1f, so they are only allowed at the edges of the token.
+RANGE_PATTERN = re.compile(
+    r'(?:^|,)\s*([+-]?\d+(?:_\d+)*)[^\S\x1c-\x1f]*-[^\S\x1c-\x1f]*([+-]?\d+(?:_\d+)*)\s*(?=,|$)'
+)
+
+
 @dataclass
 class Range:
     """Represents a numeric range with start and end values."""
@@ -24,6 +45,9 @@ class Range:
         """
         Create a Range from a string in "start-end" format.
         
+        Kept as the single-token API; iter_ranges parses whole files with
+        RANGE_PATTERN, which accepts the same tokens.
+        
         Parses a string containing two numbers separated by a dash.
         Handles negative numbers and trims whitespace. The pattern cannot
         start with zero (e.g., "01-10" is invalid).
@@ -56,18 +80,20 @@ class Range:
         return Range(start, end)
 
 
-def read_input(file_path: Path) -> List[Range]:
+def iter_ranges(file_path: Path) -> Iterator[Range]:
     """
-    Read and parse ranges from an input file.
+    Lazily parse ranges from an input file.
     
     Reads a file containing comma-separated ranges in the format
-    "start1-end1,start2-end2,...". Invalid ranges are silently skipped.
+    "start1-end1,start2-end2,...". Ranges are yielded one at a time, so the
+    solvers never hold more than one parsed range. Invalid ranges are
+    silently skipped.
     
     Args:
         file_path: Path to the input file
         
-    Returns:
-        List of parsed Range objects
+    Yields:
+        Parsed Range objects in file order
         
     Raises:
         FileNotFoundError: If the file doesn't exist
@@ -77,21 +103,98 @@ def read_input(file_path: Path) -> List[Range]:
         raise FileNotFoundError(f"File does not exist: {file_path}")
     
     try:
-        with open(file_path, 'r') as file:
-            content = file.read()
+        content = file_path.read_text()
     except Exception as e:
         raise RuntimeError(f"Cannot open file: {file_path}") from e
     
-    path_ranges = []
+    # Parse comma-separated ranges with a single lazy regex scan
+    for match in RANGE_PATTERN.finditer(content):
+        start = int(match.group(1))
+        end = int(match.group(2))
+        if start <= end:
+            yield Range(start, end)
+
+
+def read_input(file_path: Path) -> List[Range]:
+    """
+    Read and parse ranges from an input file.
+    
+    Args:
+        file_path: Path to the input file
+        
+    Returns:
+        List of parsed Range objects
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        RuntimeError: If the file cannot be opened
+    """
+    return list(iter_ranges(file_path))
+
+
+def split_by_digit_length(start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+    """
+    Split the positive part of a range into sub-ranges of equal digit length.
+    
+    A range like 95-1234 is split into 95-99, 100-999 and 1000-1234, so
+    every ID in a sub-range has the same number of digits.
+    
+    Args:
+        start: First ID of the range (inclusive)
+        end: Last ID of the range (inclusive)
+        
+    Yields:
+        Tuples (length, low, high) describing each sub-range
+    """
+    start = max(start, 1)
+    if start > end:
+        return
+    
+    for length in range(len(str(start)), len(str(end)) + 1):
+        low = max(start, 10 ** (length - 1))
+        high = min(end, 10 ** length - 1)
+        yield length, low, high
+
+
+def power_of_10(exponent: int) -> int:
+    """Return 10^exponent, using the precomputed table when possible."""
+    if exponent < len(POWERS_OF_10):
+        return POWERS_OF_10[exponent]
+    return 10 ** exponent
+
+
+def count_digits(id_num: int) -> int:
+    """
+    Count the decimal digits of a positive number without converting it to a string.
+    
+    The estimate floor(bit_length * log10(2)) is computed with the integer
+    approximation 1233 / 4096 and is either exact or one too small, which a
+    single comparison against a power of 10 corrects.
+    
+    Args:
+        id_num: The positive number to measure
+        
+    Returns:
+        The number of decimal digits
+    """
+    estimate = id_num.bit_length() * 1233 >> 12
+    return estimate + (id_num >= power_of_10(estimate))
+
+
+def pattern_multiplier(length: int, pattern_len: int) -> int:
+    """
+    Compute R = 1 + 10^d + 10^(2d) + ... + 10^(L-d) for a pattern of length d.
     
-    # Parse comma-separated ranges
-    range_strings = content.split(',')
-    for range_str in range_strings:
-        range_obj = Range.from_string(range_str)
-        if range_obj:
-            path_ranges.append(range_obj)
+    Repeating a d-digit pattern p to fill L digits gives exactly p * R.
     
-    return path_ranges
+    Args:
+        length: Total length L of the ID in digits
+        pattern_len: Length d of the pattern (must divide L)
+        
+    Returns:
+        The multiplier R
+    """
+    return sum(10 ** (i * pattern_len) for i in range(length // pattern_len))
 
 
 def has_repeating_halves(id_num: int) -> bool:
@@ -108,22 +211,140 @@ def has_repeating_halves(id_num: int) -> bool:
     Returns:
         True if the ID has repeating halves, False otherwise
     """
-    str_id = str(id_num)
-    length = len(str_id)
+    # Non-positive IDs never consist of two identical halves
+    if id_num <= 0:
+        return False
+    
+    length = count_digits(id_num)
     
     # Must have an even number of digits
     if length % 2 != 0:
         return False
     
-    half = length // 2
-    first_half = str_id[:half]
-    second_half = str_id[half:]
+    # The first half has no leading zero because the ID has exactly `length` digits
+    first_half, second_half = divmod(id_num, power_of_10(length // 2))
+    return first_half == second_half
+
+
+def sum_pattern_ids(length: int, pattern_len: int, low_id: int, high_id: int) -> int:
+    """
+    Sum all L-digit IDs within [low_id, high_id] that repeat a d-digit pattern.
     
-    # First half cannot start with zero
-    if first_half[0] == '0':
-        return False
+    The IDs are p * R for consecutive patterns p, so their sum is an arithmetic
+    series computed in closed form with Python ints (no overflow, no arrays).
     
-    return first_half == second_half
+    Args:
+        length: Number of digits L of every ID in [low_id, high_id]
+        pattern_len: Length d of the pattern (must divide L)
+        low_id: First ID of the sub-range (inclusive)
+        high_id: Last ID of the sub-range (inclusive)
+        
+    Returns:
+        The sum of the matching IDs
+    """
+    multiplier = pattern_multiplier(length, pattern_len)
+    
+    # Clip the pattern so that pattern * multiplier lies within [low_id, high_id]
+    low = max(10 ** (pattern_len - 1), -(-low_id // multiplier))
+    high = min(10 ** pattern_len - 1, high_id // multiplier)
+    if low > high:
+        return 0
+    
+    return multiplier * (low + high) * (high - low + 1) // 2
+
+
+def prime_factors(number: int) -> List[int]:
+    """Return the distinct prime factors of a positive number."""
+    factors = []
+    factor = 2
+    while factor * factor <= number:
+        if number % factor == 0:
+            factors.append(factor)
+            while number % factor == 0:
+                number //= factor
+        factor += 1
+    if number > 1:
+        factors.append(number)
+    return factors
+
+
+@lru_cache(maxsize=None)
+def sum_repeating_ids_closed_form(length: int, low_id: int, high_id: int,
+                                  halves_only: bool) -> int:
+    """
+    Sum all repeating IDs of a fixed length within [low_id, high_id] without
+    generating them.
+    
+    An ID repeating a pattern of length d also repeats every pattern length
+    that is a multiple of d and divides L, so every repeating ID has a period
+    L / q for some prime q dividing L. IDs with periods L / q1 and L / q2 are
+    exactly those with period L / (q1 * q2), so the union is summed with
+    inclusion-exclusion over the prime factors of L.
+    
+    Args:
+        length: Number of digits L of every ID in [low_id, high_id]
+        low_id: First ID of the sub-range (inclusive)
+        high_id: Last ID of the sub-range (inclusive)
+        halves_only: Only count IDs made of two identical halves
+        
+    Returns:
+        The sum of all repeating IDs in the sub-range
+    """
+    if halves_only:
+        if length % 2 != 0:
+            return 0
+        return sum_pattern_ids(length, length // 2, low_id, high_id)
+    
+    total_sum = 0
+    primes = prime_factors(length)
+    
+    for count in range(1, len(primes) + 1):
+        sign = 1 if count % 2 == 1 else -1
+        for subset in combinations(primes, count):
+            pattern_len = length
+            for prime in subset:
+                pattern_len //= prime
+            total_sum += sign * sum_pattern_ids(length, pattern_len, low_id, high_id)
+    
+    return total_sum
+
+
+def sum_repeating_ids(start: int, end: int, halves_only: bool) -> int:
+    """
+    Sum all repeating IDs within the range [start, end].
+    
+    The range is split by digit length and every bucket is summed in closed
+    form. Bucket sums are memoized, so repeated ranges, or ranges covering the
+    same full digit-length bucket, are answered without recomputation.
+    
+    Args:
+        start: First ID of the range (inclusive)
+        end: Last ID of the range (inclusive)
+        halves_only: Only count IDs made of two identical halves
+        
+    Returns:
+        The sum of all repeating IDs in the range
+    """
+    total_sum = 0
+    
+    for length, low_id, high_id in split_by_digit_length(start, end):
+        total_sum += sum_repeating_ids_closed_form(length, low_id, high_id, halves_only)
+    
+    return total_sum
+
+
+def sum_repeating_halves(start: int, end: int) -> int:
+    """
+    Sum all IDs with repeating halves within the range [start, end].
+    
+    Args:
+        start: First ID of the range (inclusive)
+        end: Last ID of the range (inclusive)
+        
+    Returns:
+        The sum of all IDs with repeating halves in the range
+    """
+    return sum_repeating_ids(start, end, halves_only=True)
 
 
 def advent_of_code_2025_day2_part1(file_path: Path) -> int:
@@ -139,13 +360,10 @@ def advent_of_code_2025_day2_part1(file_path: Path) -> int:
     Returns:
         The sum of all invalid IDs
     """
-    ranges = read_input(file_path)
     total_sum = 0
     
-    for range_obj in ranges:
-        for id_num in range(range_obj.start, range_obj.end + 1):
-            if has_repeating_halves(id_num):
-                total_sum += id_num
+    for range_obj in iter_ranges(file_path):
+        total_sum += sum_repeating_halves(range_obj.start, range_obj.end)
     
     return total_sum
 
@@ -167,38 +385,39 @@ def has_repeating_pattern(id_num: int) -> bool:
     str_id = str(id_num)
     length = len(str_id)
     
-    # Check all possible pattern lengths (from 1 to length/2)
-    for pattern_len in range(1, length // 2 + 1):
-        # Check if number length is a multiple of pattern length
-        if length % pattern_len != 0:
-            continue
-        
+    pattern_lengths = PATTERN_LENGTHS.get(length)
+    if pattern_lengths is None:
+        pattern_lengths = [d for d in range(1, length // 2 + 1) if length % d == 0]
+    
+    # Only divisors of the length can form a pattern repeated at least 2 times
+    for pattern_len in pattern_lengths:
         pattern = str_id[:pattern_len]
         
         # Pattern cannot start with zero
         if pattern[0] == '0':
             continue
         
-        repetitions = length // pattern_len
-        
-        # Must be repeated at least 2 times
-        if repetitions < 2:
-            continue
-        
         # Check if entire number consists of repetitions of this pattern
-        is_repeated = True
-        for i in range(1, repetitions):
-            segment = str_id[i * pattern_len:(i + 1) * pattern_len]
-            if segment != pattern:
-                is_repeated = False
-                break
-        
-        if is_repeated:
+        if str_id == pattern * (length // pattern_len):
             return True
     
     return False
 
 
+def sum_repeating_patterns(start: int, end: int) -> int:
+    """
+    Sum all IDs with repeating patterns within the range [start, end].
+    
+    Args:
+        start: First ID of the range (inclusive)
+        end: Last ID of the range (inclusive)
+        
+    Returns:
+        The sum of all IDs with repeating patterns in the range
+    """
+    return sum_repeating_ids(start, end, halves_only=False)
+
+
 def advent_of_code_2025_day2_part2(file_path: Path) -> int:
     """
     Solve Advent of Code 2025 Day 2 Part 2.
@@ -213,13 +432,10 @@ def advent_of_code_2025_day2_part2(file_path: Path) -> int:
     Returns:
         The sum of all IDs with repeating patterns
     """
-    ranges = read_input(file_path)
     total_sum = 0
     
-    for range_obj in ranges:
-        for id_num in range(range_obj.start, range_obj.end + 1):
-            if has_repeating_pattern(id_num):
-                total_sum += id_num
+    for range_obj in iter_ranges(file_path):
+        total_sum += sum_repeating_patterns(range_obj.start, range_obj.end)
     
     return total_sum
 